@@ -2,128 +2,346 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from operator import itemgetter
 
-from typing import Dict, List
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Set, Tuple
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi import Query, Path
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import Optional
 
 from models.person import PersonCreate, PersonRead, PersonUpdate
 from models.address import AddressCreate, AddressRead, AddressUpdate
 from models.health import Health
 
-from models.my_models import Course, Enrollment
+from models.my_models import Course, Enrollment, EnrollStatus, Term
 
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+def _resolve_host_ip() -> str:
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+# Resolved once at import; the host address does not change for the life of the process
+_HOST_IP = _resolve_host_ip()
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
-persons: Dict[UUID, PersonRead] = {}
-addresses: Dict[UUID, AddressRead] = {}
+# Keyed by UUID.int: int hashing/equality is cheaper than UUID's Python-level __hash__/__eq__
+persons: Dict[int, PersonRead] = {}
+addresses: Dict[int, AddressRead] = {}
+
+# Encoded JSON body of each stored record; point reads return it as-is and
+# list endpoints join the bodies of the matching records
+person_json: Dict[int, bytes] = {}
+address_json: Dict[int, bytes] = {}
+
+# Insertion sequence number of each record; filtered lists are returned in this order
+person_seq: Dict[int, int] = {}
+address_seq: Dict[int, int] = {}
+
+# Encoded body of each unfiltered list endpoint, keyed by table name; dropped on every write
+_all_list_json: Dict[str, bytes] = {}
+
+def _cache_address(address: AddressRead) -> None:
+    key = address.id.int
+    address_seq.setdefault(key, len(address_seq))
+    address_json[key] = orjson.dumps(address.model_dump(mode="json"))
+    _all_list_json.pop("addresses", None)
+
+def _cache_person(person: PersonRead) -> None:
+    key = person.id.int
+    person_seq.setdefault(key, len(person_seq))
+    person_json[key] = orjson.dumps(person.model_dump(mode="json"))
+    _all_list_json.pop("persons", None)
+
+def _join_bodies(bodies: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(bodies) + b"]"
+
+def _list_response(bodies: Dict[Any, bytes], keys: Iterable[Any]) -> Response:
+    return _json_response(_join_bodies([bodies[k] for k in keys]))
+
+def _all_list_response(name: str, bodies: Dict[Any, bytes]) -> Response:
+    body = _all_list_json.get(name)
+    if body is None:
+        # per-record bodies are already encoded and kept in insertion order
+        body = _all_list_json[name] = _join_bodies(bodies.values())
+    return _json_response(body)
+
+def _field_adapters(model: type[BaseModel]) -> Dict[str, TypeAdapter]:
+    return {name: TypeAdapter(Annotated[field.annotation, field]) for name, field in model.model_fields.items()}
+
+# Validators for single stored-model fields; *Update models allow None for every field
+_ADDRESS_FIELD_ADAPTERS = _field_adapters(AddressRead)
+_PERSON_FIELD_ADAPTERS = _field_adapters(PersonRead)
+
+def _validated_changes(update: BaseModel, adapters: Dict[str, TypeAdapter]) -> Dict[str, Any]:
+    """Validate the fields the client sent against the stored model.
+
+    Invalid values raise RequestValidationError, so the client gets FastAPI's usual 422
+    body with locations under ``body``. Values stay model instances (unlike model_dump),
+    ready for model_copy(update=...).
+    """
+    changes: Dict[str, Any] = {}
+    errors: List[Dict[str, Any]] = []
+    # declaration order keeps the error list stable
+    for name in (name for name in adapters if name in update.model_fields_set):
+        try:
+            changes[name] = adapters[name].validate_python(getattr(update, name))
+        except ValidationError as exc:
+            errors.extend(
+                {**error, "loc": ("body", name, *error["loc"])}
+                for error in exc.errors(include_url=False)
+            )
+    if errors:
+        raise RequestValidationError(errors)
+    return changes
+
+def _json_response(body: bytes) -> Response:
+    # returning a Response directly bypasses response_model validation/serialization
+    return Response(content=body, media_type="application/json")
 
 app = FastAPI(
     title="Person/Address API",
     description="Demo FastAPI app using Pydantic v2 models for Person and Address",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases" for Course / Enrollment
 # -----------------------------------------------------------------------------
 courses: Dict[str, Course] = {}  # key = course.code
-enrollments: Dict[str, Enrollment] = {}  # key = f"{uni}|{course_code}|{year}|{term}"
+EnrollKey = Tuple[str, str, int, str]
+enrollments: Dict[EnrollKey, Enrollment] = {}  # key = (uni, course_code, year, term)
+
+def _enroll_key(uni: str, course_code: str, year: int, term: str) -> EnrollKey:
+    return (uni, course_code, year, term)
+
+course_json: Dict[str, bytes] = {}
+enrollment_json: Dict[EnrollKey, bytes] = {}
+
+course_seq: Dict[str, int] = {}
+enrollment_seq: Dict[EnrollKey, int] = {}
+
+def _cache_course(course: Course) -> None:
+    course_seq.setdefault(course.code, len(course_seq))
+    course_json[course.code] = orjson.dumps(course.model_dump(mode="json"))
+    _all_list_json.pop("courses", None)
+
+def _cache_enrollment(key: EnrollKey, enrollment: Enrollment) -> None:
+    enrollment_seq.setdefault(key, len(enrollment_seq))
+    enrollment_json[key] = orjson.dumps(enrollment.model_dump(mode="json"))
+    _all_list_json.pop("enrollments", None)
 
-def _enroll_key(uni: str, course_code: str, year: int, term: str) -> str:
-    return f"{uni}|{course_code}|{year}|{term}"
+# -----------------------------------------------------------------------------
+# Secondary indexes: field name -> field value -> set of primary keys
+# -----------------------------------------------------------------------------
+Index = Dict[str, Dict[Any, Set[Any]]]
+
+person_index: Index = {}
+address_index: Index = {}
+course_index: Index = {}
+enrollment_index: Index = {}
+
+# (credits, code) pairs kept sorted so credit ranges can be bisected
+course_credits: List[Tuple[int, str]] = []
+
+PERSON_INDEX_FIELDS = ("uni", "first_name", "last_name", "email", "phone")
+ADDRESS_INDEX_FIELDS = ("street", "city", "state", "postal_code", "country")
+COURSE_INDEX_FIELDS = ("code", "dept_id", "instructor")
+ENROLLMENT_INDEX_FIELDS = ("uni", "course_code", "year", "term", "status")
+
+def _index_values(obj: Any, fields: Iterable[str]) -> Dict[str, Set[Any]]:
+    return {field: {getattr(obj, field)} for field in fields}
+
+def _person_index_values(person: PersonRead) -> Dict[str, Set[Any]]:
+    values = _index_values(person, PERSON_INDEX_FIELDS)
+    values["birth_date"] = {str(person.birth_date)}
+    # nested address fields: a person matches if at least one address does
+    values["city"] = {addr.city for addr in person.addresses}
+    values["country"] = {addr.country for addr in person.addresses}
+    return values
+
+def _index_add(index: Index, key: Any, values: Dict[str, Set[Any]]) -> None:
+    for field, field_values in values.items():
+        buckets = index.setdefault(field, {})
+        for value in field_values:
+            buckets.setdefault(value, set()).add(key)
+
+def _index_remove(index: Index, key: Any, values: Dict[str, Set[Any]]) -> None:
+    for field, field_values in values.items():
+        buckets = index.get(field, {})
+        for value in field_values:
+            keys = buckets.get(value)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del buckets[value]
+
+Matcher = Callable[[Any, Any], bool]
+
+# Filters with no index, checked per candidate as matcher(record, value)
+_COURSE_FILTERS: Dict[str, Matcher] = {
+    "min_credits": lambda c, v: c.credits >= v,
+    "max_credits": lambda c, v: c.credits <= v,
+}
+
+def _index_select(
+    index: Index,
+    table: Dict[Any, Any],
+    seq: Dict[Any, int],
+    filters: Dict[str, Any],
+    matchers: Optional[Dict[str, Matcher]] = None,
+) -> List[Any]:
+    """Return the keys of matching records, in insertion order.
+
+    Candidates come from the most selective indexed filter; the rest are checked in a single pass.
+
+    Every filter without an entry in ``matchers`` is indexed and is checked by probing
+    its key bucket, so no record attributes are read for it.
+    Filters whose value is None are ignored; with no filters every record is returned.
+    Keys are ordered by ``seq``, as a full scan of ``table`` would return them.
+    """
+    matchers = matchers or {}
+    active = [(field, value) for field, value in filters.items() if value is not None]
+    buckets = [index.get(field, {}).get(value, ()) for field, value in active if field not in matchers]
+    checks = [(matchers[field], value) for field, value in active if field in matchers]
+    if not buckets:
+        if not checks:
+            return list(table)
+        return [k for k, obj in table.items() if all(match(obj, value) for match, value in checks)]
+    # most selective first: candidates come from the smallest bucket, and membership
+    # probes that are likeliest to fail run before the others
+    buckets.sort(key=len)
+    if not buckets[0]:
+        return []
+    first, rest = buckets[0], buckets[1:]
+    keys = [
+        k for k in first
+        if all(k in bucket for bucket in rest)
+        and all(match(table[k], value) for match, value in checks)
+    ]
+    keys.sort(key=seq.__getitem__)
+    return keys
 
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
+# (epoch second, ISO timestamp for that second); /health reuses it within the same second
+_health_timestamp: Tuple[int, str] = (-1, "")
+
+def _utc_timestamp() -> str:
+    global _health_timestamp
+    now = int(time.time())
+    last_sec, cached_iso = _health_timestamp
+    if now != last_sec:
+        cached_iso = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _health_timestamp = (now, cached_iso)
+    return cached_iso
+
 def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=_utc_timestamp(),
+        ip_address=_HOST_IP,
         echo=echo,
         path_echo=path_echo
     )
 
 @app.get("/health", response_model=Health)
-def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
+async def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
     # Works because path_echo is optional in the model
     return make_health(echo=echo, path_echo=None)
 
 @app.get("/health/{path_echo}", response_model=Health)
-def get_health_with_path(
+async def get_health_with_path(
     path_echo: str = Path(..., description="Required echo in the URL path"),
     echo: str | None = Query(None, description="Optional echo string"),
 ):
     return make_health(echo=echo, path_echo=path_echo)
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
-def create_address(address: AddressCreate):
-    if address.id in addresses:
+async def create_address(address: AddressCreate):
+    key = address.id.int
+    if key in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    # input is already validated; model_construct skips a second validation pass.
+    # dict(model) is a shallow field copy, so nested models stay model instances.
+    addresses[key] = AddressRead.model_construct(**dict(address))
+    _cache_address(addresses[key])
+    _index_add(address_index, key, _index_values(addresses[key], ADDRESS_INDEX_FIELDS))
+    return addresses[key]
 
 @app.get("/addresses", response_model=List[AddressRead])
-def list_addresses(
+async def list_addresses(
     street: Optional[str] = Query(None, description="Filter by street"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state/region"),
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+    filters = {
+        "street": street,
+        "city": city,
+        "state": state,
+        "postal_code": postal_code,
+        "country": country,
+    }
+    if all(value is None for value in filters.values()):
+        return _all_list_response("addresses", address_json)
+    keys = _index_select(address_index, addresses, address_seq, filters)
+    return _list_response(address_json, keys)
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
-    if address_id not in addresses:
+async def get_address(address_id: UUID):
+    key = address_id.int
+    if key not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return _json_response(address_json[key])
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
-    if address_id not in addresses:
+async def update_address(address_id: UUID, update: AddressUpdate):
+    key = address_id.int
+    if key not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    changes = _validated_changes(update, _ADDRESS_FIELD_ADAPTERS)
+    _index_remove(address_index, key, _index_values(addresses[key], ADDRESS_INDEX_FIELDS))
+    addresses[key] = addresses[key].model_copy(update=changes)
+    _cache_address(addresses[key])
+    _index_add(address_index, key, _index_values(addresses[key], ADDRESS_INDEX_FIELDS))
+    return addresses[key]
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 @app.post("/persons", response_model=PersonRead, status_code=201)
-def create_person(person: PersonCreate):
+async def create_person(person: PersonCreate):
     # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
+    person_read = PersonRead.model_construct(**dict(person))
+    persons[person_read.id.int] = person_read
+    _cache_person(person_read)
+    _index_add(person_index, person_read.id.int, _person_index_values(person_read))
     return person_read
 
 @app.get("/persons", response_model=List[PersonRead])
-def list_persons(
+async def list_persons(
     uni: Optional[str] = Query(None, description="Filter by Columbia UNI"),
     first_name: Optional[str] = Query(None, description="Filter by first name"),
     last_name: Optional[str] = Query(None, description="Filter by last name"),
@@ -133,154 +351,172 @@ def list_persons(
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+    filters = {
+        "uni": uni,
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": email,
+        "phone": phone,
+        "birth_date": birth_date,
+        "city": city,
+        "country": country,
+    }
+    if all(value is None for value in filters.values()):
+        return _all_list_response("persons", person_json)
+    keys = _index_select(person_index, persons, person_seq, filters)
+    return _list_response(person_json, keys)
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
-    if person_id not in persons:
+async def get_person(person_id: UUID):
+    key = person_id.int
+    if key not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return _json_response(person_json[key])
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
-    if person_id not in persons:
+async def update_person(person_id: UUID, update: PersonUpdate):
+    key = person_id.int
+    if key not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    changes = _validated_changes(update, _PERSON_FIELD_ADAPTERS)
+    _index_remove(person_index, key, _person_index_values(persons[key]))
+    persons[key] = persons[key].model_copy(update=changes)
+    _cache_person(persons[key])
+    _index_add(person_index, key, _person_index_values(persons[key]))
+    return persons[key]
 
 # -----------------------------------------------------------------------------
 # Course endpoints
 # -----------------------------------------------------------------------------
 @app.post("/courses", response_model=Course, status_code=201)
-def create_course(course: Course):
+async def create_course(course: Course):
+    # interned codes keep one hashed str per code for every later dict probe
+    course = course.model_copy(update={"code": sys.intern(course.code)})
     if course.code in courses:
         raise HTTPException(status_code=400, detail="Course with this code already exists")
     courses[course.code] = course
+    _cache_course(course)
+    _index_add(course_index, course.code, _index_values(course, COURSE_INDEX_FIELDS))
+    insort(course_credits, (course.credits, course.code))
     return course
 
 @app.get("/courses", response_model=List[Course])
-def list_courses(
+async def list_courses(
     code: Optional[str] = Query(None, description="Filter by exact course code, e.g., 'COMS W4153'"),
     dept_id: Optional[str] = Query(None, description="Filter by department id, e.g., 'COMS'"),
     instructor: Optional[str] = Query(None, description="Filter by instructor name"),
     min_credits: Optional[int] = Query(None, ge=0, description="Minimum credits"),
     max_credits: Optional[int] = Query(None, ge=0, description="Maximum credits"),
 ):
-    results = list(courses.values())
-    if code is not None:
-        results = [c for c in results if c.code == code]
-    if dept_id is not None:
-        results = [c for c in results if c.dept_id == dept_id]
-    if instructor is not None:
-        results = [c for c in results if c.instructor == instructor]
-    if min_credits is not None:
-        results = [c for c in results if c.credits >= min_credits]
-    if max_credits is not None:
-        results = [c for c in results if c.credits <= max_credits]
-    return results
+    filters = {
+        "code": code,
+        "dept_id": dept_id,
+        "instructor": instructor,
+        "min_credits": min_credits,
+        "max_credits": max_credits,
+    }
+    if all(value is None for value in filters.values()):
+        return _all_list_response("courses", course_json)
+    if code is None and dept_id is None and instructor is None and (
+        min_credits is not None or max_credits is not None
+    ):
+        # credit range only: the sorted (credits, code) list answers it directly
+        credits_of = itemgetter(0)
+        lo = 0 if min_credits is None else bisect_left(course_credits, min_credits, key=credits_of)
+        hi = len(course_credits) if max_credits is None else bisect_right(course_credits, max_credits, key=credits_of)
+        keys = sorted((c for _, c in course_credits[lo:hi]), key=course_seq.__getitem__)
+    else:
+        keys = _index_select(course_index, courses, course_seq, filters, _COURSE_FILTERS)
+    return _list_response(course_json, keys)
 
 @app.get("/courses/{course_code}", response_model=Course)
-def get_course(
+async def get_course(
     course_code: str = Path(..., description="Catalog code, e.g., 'COMS W4153'")
 ):
+    course_code = sys.intern(course_code)
     if course_code not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_code]
+    return _json_response(course_json[course_code])
 
 # -----------------------------------------------------------------------------
 # Enrollment endpoints
 # -----------------------------------------------------------------------------
 @app.post("/enrollments", response_model=Enrollment, status_code=201)
-def create_enrollment(enrollment: Enrollment):
+async def create_enrollment(enrollment: Enrollment):
+    enrollment = enrollment.model_copy(update={
+        "uni": sys.intern(enrollment.uni),
+        "course_code": sys.intern(enrollment.course_code),
+    })
     key = _enroll_key(enrollment.uni, enrollment.course_code, enrollment.year, enrollment.term)
     if key in enrollments:
         raise HTTPException(status_code=400, detail="Enrollment already exists for this (uni, course, year, term)")
     enrollments[key] = enrollment
+    _cache_enrollment(key, enrollment)
+    _index_add(enrollment_index, key, _index_values(enrollment, ENROLLMENT_INDEX_FIELDS))
     return enrollment
 
 @app.get("/enrollments", response_model=List[Enrollment])
-def list_enrollments(
+async def list_enrollments(
     uni: Optional[str] = Query(None, description="Filter by student UNI"),
     course_code: Optional[str] = Query(None, description="Filter by course catalog code"),
     year: Optional[int] = Query(None, description="Filter by academic year"),
-    term: Optional[str] = Query(None, description="Filter by term: 'FALL','SPRING','SUMMER'"),
-    status: Optional[str] = Query(None, description="Filter by status: 'enrolled','waitlisted','dropped'"),
+    term: Optional[Term] = Query(None, description="Filter by term: 'FALL','SPRING','SUMMER'"),
+    status: Optional[EnrollStatus] = Query(None, description="Filter by status: 'enrolled','waitlisted','dropped'"),
 ):
-    results = list(enrollments.values())
-    if uni is not None:
-        results = [e for e in results if e.uni == uni]
-    if course_code is not None:
-        results = [e for e in results if e.course_code == course_code]
-    if year is not None:
-        results = [e for e in results if e.year == year]
-    if term is not None:
-        results = [e for e in results if e.term == term]
-    if status is not None:
-        results = [e for e in results if e.status == status]
-    return results
+    filters = {
+        "uni": uni,
+        "course_code": course_code,
+        "year": year,
+        "term": term,
+        "status": status,
+    }
+    if all(value is None for value in filters.values()):
+        return _all_list_response("enrollments", enrollment_json)
+    keys = _index_select(enrollment_index, enrollments, enrollment_seq, filters)
+    return _list_response(enrollment_json, keys)
 
 @app.get(
     "/enrollments/{uni}/{course_code}/{year}/{term}",
     response_model=Enrollment
 )
-def get_enrollment(
+async def get_enrollment(
     uni: str = Path(..., description="Student UNI"),
     course_code: str = Path(..., description="Course catalog code"),
     year: int = Path(..., description="Academic year"),
-    term: str = Path(..., description="Term: 'FALL','SPRING','SUMMER'"),
+    term: Term = Path(..., description="Term: 'FALL','SPRING','SUMMER'"),
 ):
     key = _enroll_key(uni, course_code, year, term)
     if key not in enrollments:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    return enrollments[key]
+    return _json_response(enrollment_json[key])
 
 @app.patch(
     "/enrollments/{uni}/{course_code}/{year}/{term}",
     response_model=Enrollment
 )
-def update_enrollment_status(
+async def update_enrollment_status(
     uni: str = Path(..., description="Student UNI"),
     course_code: str = Path(..., description="Course catalog code"),
     year: int = Path(..., description="Academic year"),
-    term: str = Path(..., description="Term: 'FALL','SPRING','SUMMER'"),
-    status: str = Query(..., description="New status: 'enrolled','waitlisted','dropped'"),
+    term: Term = Path(..., description="Term: 'FALL','SPRING','SUMMER'"),
+    status: EnrollStatus = Query(..., description="New status: 'enrolled','waitlisted','dropped'"),
 ):
     key = _enroll_key(uni, course_code, year, term)
     if key not in enrollments:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    current = enrollments[key].model_dump()
-    current["status"] = status
-    enrollments[key] = Enrollment(**current)
+    current = enrollments[key]
+    _index_remove(enrollment_index, key, {"status": {current.status}})
+    # Enrollment is frozen; model_copy makes a shallow copy with only status replaced
+    enrollments[key] = current.model_copy(update={"status": status})
+    _cache_enrollment(key, enrollments[key])
+    _index_add(enrollment_index, key, {"status": {status}})
     return enrollments[key]
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to the Person/Address API. See /docs for OpenAPI UI."}
 
 # -----------------------------------------------------------------------------
@@ -289,4 +525,6 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    # uvloop has no Windows build; fall back to the stock asyncio loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True, loop=loop, http="httptools")
\ No newline at end of file
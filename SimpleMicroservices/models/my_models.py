@@ -1,5 +1,17 @@
+from enum import StrEnum
 from pydantic import BaseModel, Field, EmailStr
 from typing import Optional
+
+class Term(StrEnum):
+    FALL = "FALL"
+    SPRING = "SPRING"
+    SUMMER = "SUMMER"
+
+class EnrollStatus(StrEnum):
+    ENROLLED = "enrolled"
+    WAITLISTED = "waitlisted"
+    DROPPED = "dropped"
+
 class Course(BaseModel):
     code: str = Field(..., description="Catalog code, e.g., 'COMS W4153'")
     title: str = Field(..., description="Course title")
@@ -8,6 +20,8 @@ class Course(BaseModel):
     dept_id: str = Field(..., description="Department identifier, e.g., 'COMS'")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "code": "COMS W4153",
@@ -23,10 +37,12 @@ class Enrollment(BaseModel):
     uni: str = Field(..., min_length=2, description="Student UNI, e.g., 'abc1234'")
     course_code: str = Field(..., description="Course catalog code, e.g., 'COMS W4153'")
     year: int = Field(..., description="Academic year, e.g., 2025")
-    term: str = Field(..., description="Term identifier: 'FALL', 'SPRING', 'SUMMER'")
-    status: str = Field(..., description="Enrollment status: 'enrolled', 'waitlisted', 'dropped'")
+    term: Term = Field(..., description="Term identifier: 'FALL', 'SPRING', 'SUMMER'")
+    status: EnrollStatus = Field(..., description="Enrollment status: 'enrolled', 'waitlisted', 'dropped'")
 
     model_config = {
+        "frozen": True,
+        "extra": "forbid",
         "json_schema_extra": {
             "example": {
                 "uni": "abc1234",